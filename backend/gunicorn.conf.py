@@ -0,0 +1,67 @@
+"""
+Gunicorn configuration for the Aerial Threat Detection backend
+
+Every setting can be overridden through an environment variable so the same
+file works on a laptop and on a bigger box:
+
+    ATD_BIND, ATD_WORKERS, ATD_TIMEOUT, ATD_GRACEFUL_TIMEOUT,
+    ATD_MAX_REQUESTS, ATD_LOG_LEVEL
+"""
+import multiprocessing
+import os
+
+# The detector checks for CUDA while the app is preloaded in the master. Ask
+# torch to do that check through NVML so the master never initialises the CUDA
+# runtime, which would leave forked workers unable to use the GPU. This must
+# be set before torch is imported, i.e. before the app is loaded.
+os.environ.setdefault('PYTORCH_NVML_BASED_CUDA_CHECK', '1')
+
+
+def _env_int(name, default):
+    return int(os.environ.get(name, default))
+
+
+bind = os.environ.get('ATD_BIND', '127.0.0.1:5000')
+
+# Inference is CPU/GPU bound, so keep the worker count close to the core count
+# instead of the usual 2 * cores + 1.
+workers = _env_int('ATD_WORKERS', max(1, min(4, multiprocessing.cpu_count())))
+
+# The detector wraps a single YOLO model, which is not thread-safe, so each
+# worker handles one request at a time. Sync workers only accept a connection
+# when idle, so a request never queues behind a long video job in one worker
+# while others are free. They close the connection after every response;
+# put a reverse proxy (e.g. nginx) in front if clients need keep-alive.
+worker_class = 'sync'
+
+# Load the model in the master before forking. On CPU the weights are then
+# shared copy-on-write between workers; on GPU each worker still copies the
+# weights to the device itself on first inference.
+preload_app = True
+
+# A sync worker busy on one request for longer than this is killed and
+# restarted. Video processing can take minutes, so the limit is generous.
+timeout = _env_int('ATD_TIMEOUT', 300)
+# On SIGTERM, workers get this long to finish in-flight requests. It matches
+# the worker timeout so any request that could complete is allowed to.
+graceful_timeout = _env_int('ATD_GRACEFUL_TIMEOUT', timeout)
+
+# Recycle workers periodically to bound memory growth from long video jobs.
+max_requests = _env_int('ATD_MAX_REQUESTS', 1000)
+max_requests_jitter = max_requests // 10 if max_requests else 0
+
+accesslog = '-'
+errorlog = '-'
+loglevel = os.environ.get('ATD_LOG_LEVEL', 'info')
+
+
+def post_fork(server, worker):
+    """Split CPU threads between workers so torch does not oversubscribe cores"""
+    try:
+        import torch
+    except ImportError:
+        return
+    # Read the effective count so `-w` and GUNICORN_CMD_ARGS overrides apply
+    per_worker = max(1, multiprocessing.cpu_count() // server.cfg.workers)
+    torch.set_num_threads(per_worker)
+    server.log.info("Worker %s using %s torch threads", worker.pid, per_worker)
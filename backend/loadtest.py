@@ -0,0 +1,141 @@
+"""
+Simple load test for the /api/detect endpoint
+
+Uploads an image repeatedly from several concurrent clients and reports
+throughput and latency percentiles. Uses only the standard library.
+
+    python loadtest.py path/to/image.jpg --requests 200 --concurrency 8
+"""
+import argparse
+import http.client
+import math
+import mimetypes
+import os
+import statistics
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlparse
+
+
+def build_multipart(image_path):
+    """Build a multipart/form-data body with the image in the 'file' field"""
+    boundary = uuid.uuid4().hex
+    filename = os.path.basename(image_path)
+    content_type = mimetypes.guess_type(filename)[0] or 'application/octet-stream'
+
+    with open(image_path, 'rb') as f:
+        data = f.read()
+
+    body = (
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="file"; filename="{filename}"\r\n'
+        f'Content-Type: {content_type}\r\n\r\n'
+    ).encode() + data + f'\r\n--{boundary}--\r\n'.encode()
+
+    return body, f'multipart/form-data; boundary={boundary}'
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a sorted list"""
+    if not values:
+        return 0.0
+    index = max(0, min(len(values) - 1, math.ceil(pct / 100 * len(values)) - 1))
+    return values[index]
+
+
+def run(url, image_path, total_requests, concurrency, warmup):
+    parsed = urlparse(url)
+    path = parsed.path or '/'
+    if parsed.query:
+        path = f'{path}?{parsed.query}'
+    body, content_type = build_multipart(image_path)
+    headers = {'Content-Type': content_type, 'Connection': 'keep-alive'}
+
+    # One connection per client thread, reused when the server keeps it alive
+    local = threading.local()
+
+    def post(conn):
+        conn.request('POST', path, body=body, headers=headers)
+        response = conn.getresponse()
+        response.read()
+        return response.status
+
+    def send_one():
+        conn = getattr(local, 'conn', None)
+        if conn is None:
+            conn = http.client.HTTPConnection(parsed.hostname, parsed.port or 80, timeout=300)
+            local.conn = conn
+        # http.client drops the socket once the server closes the connection
+        reused = conn.sock is not None
+
+        start = time.perf_counter()
+        try:
+            status = post(conn)
+        except (OSError, http.client.HTTPException):
+            conn.close()
+            status = None
+            if reused:
+                # The server may have closed the idle connection (e.g. a worker
+                # was recycled), so retry once on a fresh connection
+                start = time.perf_counter()
+                try:
+                    status = post(conn)
+                except (OSError, http.client.HTTPException):
+                    conn.close()
+        return time.perf_counter() - start, status
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        # Send unmeasured requests first so model setup on the server is mostly
+        # excluded; this does not guarantee every server worker is warmed up
+        list(pool.map(lambda _: send_one(), range(warmup)))
+
+        started = time.perf_counter()
+        results = list(pool.map(lambda _: send_one(), range(total_requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies = sorted(latency for latency, status in results if status == 200)
+    errors = sum(1 for _, status in results if status is None)
+    bad_status = len(results) - len(latencies) - errors
+
+    print(f"Target:       {url}")
+    print(f"Image:        {image_path} ({len(body) / 1024:.1f} KB request body)")
+    print(f"Requests:     {total_requests} ({bad_status} non-200, {errors} connection errors)")
+    print(f"Concurrency:  {concurrency}")
+    print(f"Duration:     {elapsed:.2f} s")
+    print(f"Requests/sec: {len(latencies) / elapsed:.2f}")
+    if latencies:
+        print(f"Latency p50:  {percentile(latencies, 50) * 1000:.1f} ms")
+        print(f"Latency p99:  {percentile(latencies, 99) * 1000:.1f} ms")
+        print(f"Latency mean: {statistics.mean(latencies) * 1000:.1f} ms")
+        print(f"Latency max:  {latencies[-1] * 1000:.1f} ms")
+
+    return 0 if len(latencies) == len(results) else 1
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Load test the /api/detect endpoint')
+    parser.add_argument('image', help='Image file to upload')
+    parser.add_argument('--url', default='http://127.0.0.1:5000/api/detect')
+    parser.add_argument('--requests', type=int, default=100, help='Number of measured requests')
+    parser.add_argument('--concurrency', type=int, default=4, help='Number of concurrent clients')
+    parser.add_argument('--warmup', type=int, default=None,
+                        help='Unmeasured requests sent first (default: 2 * concurrency)')
+    args = parser.parse_args()
+
+    if urlparse(args.url).scheme != 'http':
+        parser.error('--url must be an http:// URL')
+    if args.requests < 1:
+        parser.error('--requests must be at least 1')
+    if args.concurrency < 1:
+        parser.error('--concurrency must be at least 1')
+    if args.warmup is not None and args.warmup < 0:
+        parser.error('--warmup must not be negative')
+
+    warmup = args.warmup if args.warmup is not None else 2 * args.concurrency
+    raise SystemExit(run(args.url, args.image, args.requests, args.concurrency, warmup))
+
+
+if __name__ == '__main__':
+    main()
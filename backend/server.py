@@ -5,6 +5,7 @@ import os
 import re
 import time
 import mimetypes
+import uuid
 from pathlib import Path
 from detect import ThreatDetector
 import tempfile
@@ -31,6 +32,10 @@ def is_video(filename):
     ext = filename.rsplit('.', 1)[1].lower()
     return ext in {'mp4', 'avi', 'mov'}
 
+def unique_upload_name(filename):
+    """Prefix an upload name so concurrent requests (and workers) never share a path"""
+    return f"{uuid.uuid4().hex[:12]}_{filename}"
+
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
@@ -53,10 +58,12 @@ def detect():
     if not allowed_file(file.filename):
         return jsonify({'error': 'Invalid file type'}), 400
     
+    filepath = None
     try:
         # Save uploaded file
         filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+        stored_name = unique_upload_name(filename)
+        filepath = os.path.join(app.config['UPLOAD_FOLDER'], stored_name)
         file.save(filepath)
         
         # Check if video or image
@@ -76,7 +83,7 @@ def detect():
                 max_size = 1080  # Full resolution
             
             # Process video and create output file
-            output_filename = f'processed_{filename}'
+            output_filename = f'processed_{stored_name}'
             output_path = os.path.join(app.config['UPLOAD_FOLDER'], output_filename)
             
             # Use the optimized processing method
@@ -98,9 +105,6 @@ def detect():
                 }
             }
             
-            # Clean up input file
-            os.remove(filepath)
-            
             return jsonify(response), 200
         else:
             # Process image
@@ -108,13 +112,15 @@ def detect():
             result['type'] = 'image'
             result['filename'] = filename
             
-            # Clean up
-            os.remove(filepath)
-            
             return jsonify(result), 200
     
     except Exception as e:
         return jsonify({'error': str(e)}), 500
+    
+    finally:
+        # Clean up input file, including when detection fails
+        if filepath and os.path.exists(filepath):
+            os.remove(filepath)
 
 @app.route('/api/detect/video-stream', methods=['POST'])
 def detect_video_stream():
@@ -129,23 +135,32 @@ def detect_video_stream():
     if not allowed_file(file.filename) or not is_video(file.filename):
         return jsonify({'error': 'Invalid video file'}), 400
     
+    filepath = None
     try:
         # Save uploaded file
         filename = secure_filename(file.filename)
-        filepath = os.path.join(app.config['UPLOAD_FOLDER'], filename)
+        stored_name = unique_upload_name(filename)
+        filepath = os.path.join(app.config['UPLOAD_FOLDER'], stored_name)
         file.save(filepath)
         
         def generate():
             for frame_result in detector.detect_video(filepath):
                 yield f"data: {jsonify(frame_result).get_data(as_text=True)}\n\n"
-            
-            # Clean up
-            os.remove(filepath)
+        
+        def cleanup():
+            # Runs when the response is closed, including when detection fails
+            # or the client disconnects mid-stream
+            if os.path.exists(filepath):
+                os.remove(filepath)
         
         from flask import Response
-        return Response(generate(), mimetype='text/event-stream')
+        response = Response(generate(), mimetype='text/event-stream')
+        response.call_on_close(cleanup)
+        return response
     
     except Exception as e:
+        if filepath and os.path.exists(filepath):
+            os.remove(filepath)
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/model/info', methods=['GET'])
@@ -231,6 +246,8 @@ def serve_video(filename):
         return jsonify({'error': str(e)}), 500
 
 if __name__ == '__main__':
-    print("Starting Aerial Threat Detection Server...")
+    # Development server only; use `gunicorn -c gunicorn.conf.py wsgi:app` in production
+    debug = os.environ.get('FLASK_DEBUG', '0') == '1'
+    print("Starting Aerial Threat Detection Server (development mode)...")
     print("Model loaded successfully!")
-    app.run(host='127.0.0.1', port=5000, debug=True)
\ No newline at end of file
+    app.run(host='127.0.0.1', port=5000, debug=debug)
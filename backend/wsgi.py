@@ -0,0 +1,12 @@
+"""
+WSGI entry point for production serving
+
+Importing this module loads the YOLO model once. Gunicorn is configured with
+preload_app so this happens in the master process before workers fork; see
+gunicorn.conf.py for how the weights are shared.
+
+    gunicorn -c gunicorn.conf.py wsgi:app
+"""
+from server import app
+
+__all__ = ['app']